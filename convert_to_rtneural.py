@@ -1,97 +1,97 @@
 #!/usr/bin/env python3
 """
 Convert pure RL policy from Flax/JAX format to RTNeural format.
+
+Thin wrapper around orbax_to_rtneural.convert_to_rtneural using the
+"combined" dense style (activation stored on each dense layer).
 """
 
-import json
-import numpy as np
+import os
+import shutil
+from pathlib import Path
+
+from orbax_to_rtneural import convert_to_rtneural, load_flax_json, save_rtneural_json
+
+
+def _detect_format(source) -> str:
+    """
+    Classify a loaded file by its top-level keys: 'rtneural' once both
+    'layers' and 'in_shape' are seen, 'flax' once 'policy' is seen, else None.
+    
+    Keys of a LazyFlaxJson are streamed and the scan stops at the first match,
+    so the weights that follow 'layers' or 'policy' are never tokenized.
+    """
+    missing = {'layers', 'in_shape'}
+    for key in source:
+        if key == 'policy':
+            return 'flax'
+        missing.discard(key)
+        if not missing:
+            return 'rtneural'
+    return None
 
 
-def convert_policy(input_path: str, output_path: str):
-    with open(input_path, 'r') as f:
-        data = json.load(f)
+def convert_policy(input_path: str, output_path: str, binary: bool = False,
+                   pretranspose: bool = False, npz: bool = False, quant: str = None,
+                   force: bool = False):
+    source = load_flax_json(input_path)
+    
+    input_format = _detect_format(source)
+    if input_format is None:
+        raise ValueError(f"{input_path} is neither a Flax export (no 'policy') "
+                         "nor RTNeural JSON (no 'layers'/'in_shape')")
     
     # Check if already in RTNeural format
-    if 'layers' in data and 'in_shape' in data:
+    if input_format == 'rtneural':
         print(f"File {input_path} appears to already be in RTNeural format")
+        if not force:
+            # Pass it through as-is rather than parsing and re-encoding the weights
+            if os.path.abspath(input_path) != os.path.abspath(output_path):
+                shutil.copyfile(input_path, output_path)
+                print(f"Copied {input_path} -> {output_path} (use --force to re-convert from the Flax backup)")
+            return
         # Re-read the original file
-        import shutil
         backup_path = input_path + '.flax_backup'
         # Check if we have a backup
-        import os
         if not os.path.exists(backup_path):
             print("No Flax backup found, cannot convert")
             return
-        with open(backup_path, 'r') as f:
-            data = json.load(f)
-    
-    # Extract the network params
-    params = data['policy']['params']['params']
-    normalizer = data.get('normalizer', {})
-    
-    # Build RTNeural format
-    rtneural = {
-        # Model metadata
-        "in_shape": [1, 720],  # 20 frames * 36 features
-        "observation_history": 20,
-        
-        # Controller parameters - adjust these as needed
-        "kp": 7.5,
-        "kd": 0.25,
-        "action_scale": 0.5,
-        "use_imu": True,
-        
-        # Default joint positions (typical pupper values)
-        "default_joint_pos": [0.26, 0.0, -0.52, -0.26, 0.0, 0.52, 0.26, 0.0, -0.52, -0.26, 0.0, 0.52],
-        
-        # Joint limits
-        "joint_upper_limits": [0.8, 1.2, 0.0, 0.0, 1.2, 1.2, 0.8, 1.2, 0.0, 0.0, 1.2, 1.2],
-        "joint_lower_limits": [-0.0, -1.2, -1.2, -0.8, -1.2, -0.0, -0.0, -1.2, -1.2, -0.8, -1.2, -0.0],
-        
-        # Normalizer (pass through from original)
-        "normalizer": normalizer,
-        
-        # RTNeural layers
-        "layers": []
-    }
-    
-    # Layer names in order
-    layer_names = ['hidden_0', 'hidden_1', 'hidden_2', 'hidden_3', 'hidden_4']
-    
-    for i, layer_name in enumerate(layer_names):
-        layer_params = params[layer_name]
-        kernel = layer_params['kernel']  # shape: [in_features, out_features]
-        bias = layer_params['bias']      # shape: [out_features]
-        
-        # Determine activation (last layer has no activation)
-        is_last = (i == len(layer_names) - 1)
-        activation = "" if is_last else "elu"  # Using ELU like typical RL policies
-        
-        # RTNeural expects weights as [kernel, bias] where kernel is [in, out]
-        layer = {
-            "type": "dense",
-            "activation": activation,
-            "shape": [len(kernel), len(kernel[0])],  # [in_features, out_features]
-            "weights": [kernel, bias]  # Combined [kernel, bias]
-        }
-        
-        rtneural["layers"].append(layer)
+        source = load_flax_json(backup_path)
+        if _detect_format(source) != 'flax':
+            raise ValueError(f"{backup_path} is not a Flax export (no 'policy')")
     
-    # Write output
-    with open(output_path, 'w') as f:
-        json.dump(rtneural, f)
+    npz_path = Path(output_path).with_suffix('.npz') if npz else None
+    rtneural = convert_to_rtneural(source, dense_style="combined", binary=binary,
+                                   pretranspose=pretranspose, npz_path=npz_path, quant=quant)
+    save_rtneural_json(rtneural, output_path)
     
     print(f"Converted {input_path} -> {output_path}")
+    if npz_path is not None:
+        print(f"Weights written to {npz_path}")
     print(f"Input shape: {rtneural['in_shape']}")
     print(f"Number of layers: {len(rtneural['layers'])}")
-    for i, layer in enumerate(rtneural['layers']):
-        print(f"  Layer {i}: {layer['type']} {layer['shape']} activation={layer['activation']}")
-    print(f"Normalizer mean length: {len(normalizer.get('mean', []))}")
-    print(f"Normalizer std length: {len(normalizer.get('std', []))}")
+    print(f"Normalizer mean length: {len(rtneural['normalizer'].get('mean', []))}")
+    print(f"Normalizer std length: {len(rtneural['normalizer'].get('std', []))}")
 
 
 if __name__ == "__main__":
-    import sys
-    input_file = sys.argv[1] if len(sys.argv) > 1 else "pure_rl_policy_flax.json"
-    output_file = sys.argv[2] if len(sys.argv) > 2 else "pure_rl_policy.json"
-    convert_policy(input_file, output_file)
+    import argparse
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument("input_file", nargs="?", default="pure_rl_policy_flax.json")
+    parser.add_argument("output_file", nargs="?", default="pure_rl_policy.json")
+    parser.add_argument("--binary", action="store_true",
+                        help="Store weights as base64 float32 buffers (not readable by stock RTNeural)")
+    parser.add_argument("--pretranspose", action="store_true",
+                        help="Store kernels as [out, in] row-major (sets weights_layout; "
+                             "not readable by stock RTNeural, which would silently misload them)")
+    parser.add_argument("--npz", action="store_true",
+                        help="Write weights to a .npz sidecar and reference them from the JSON")
+    parser.add_argument("--quant", choices=["int8"], default=None,
+                        help="Quantize kernels to int8 with per-output-channel scales")
+    parser.add_argument("--force", action="store_true",
+                        help="If the input is already RTNeural, re-convert from its .flax_backup "
+                             "instead of copying it")
+    args = parser.parse_args()
+    convert_policy(args.input_file, args.output_file, binary=args.binary,
+                   pretranspose=args.pretranspose, npz=args.npz, quant=args.quant,
+                   force=args.force)
@@ -8,34 +8,196 @@ Usage:
     
     # From Flax JSON export:
     python orbax_to_rtneural.py flax_policy.json output.json
+    
+    # Store weights as base64 float32 buffers instead of nested lists:
+    python orbax_to_rtneural.py checkpoint_dir output.json --binary
+    
+    # Store weights in an output.npz sidecar, JSON keeps metadata only:
+    python orbax_to_rtneural.py checkpoint_dir output.json --npz
+    
+    # Quantize kernels to int8 with per-output-channel scales:
+    python orbax_to_rtneural.py checkpoint_dir output.json --quant int8
 """
 
+import argparse
+import base64
+import functools
 import json
 import numpy as np
+import re
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Union
 import sys
 
+# Dense layer names produced by Flax/Brax MLPs, e.g. 'hidden_0', 'Dense_0', '0'
+LAYER_NAME_PATTERN = re.compile(r'^(?:hidden_|Dense_)?(\d+)$')
+
+# Default joint values for Pupper (12 joints). Kept in float64 so the JSON
+# metadata reads 0.26 rather than 0.25999999046325684; read-only because
+# convert_to_rtneural hands out copies of them.
+DEFAULT_JOINT_POS = np.array([0.26, 0.0, -0.52, -0.26, 0.0, 0.52,
+                              0.26, 0.0, -0.52, -0.26, 0.0, 0.52])
+JOINT_UPPER_LIMITS = np.array([0.8, 1.2, 0.0, 0.0, 1.2, 1.2,
+                               0.8, 1.2, 0.0, 0.0, 1.2, 1.2])
+JOINT_LOWER_LIMITS = np.array([-0.0, -1.2, -1.2, -0.8, -1.2, -0.0,
+                               -0.0, -1.2, -1.2, -0.8, -1.2, -0.0])
+DEFAULT_JOINT_POS.flags.writeable = False
+JOINT_UPPER_LIMITS.flags.writeable = False
+JOINT_LOWER_LIMITS.flags.writeable = False
+
+# Controller metadata written ahead of the layers. convert_to_rtneural takes
+# its keyword defaults from here; use_imu is not overridable.
+DEFAULT_META = {
+    "in_shape": [1, 720],  # 20 frames * 36 features
+    "observation_history": 20,
+    "kp": 7.5,
+    "kd": 0.25,
+    "action_scale": 0.5,
+    "use_imu": True,
+    "default_joint_pos": DEFAULT_JOINT_POS,
+    "joint_upper_limits": JOINT_UPPER_LIMITS,
+    "joint_lower_limits": JOINT_LOWER_LIMITS,
+}
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+@functools.lru_cache(maxsize=1)
+def _checkpointer():
+    """Shared PyTreeCheckpointer, so orbax is imported and set up only once."""
+    import orbax.checkpoint as ocp
+    return ocp.PyTreeCheckpointer()
+
 
 def load_orbax_checkpoint(checkpoint_path: Path) -> dict:
     """Load weights from Orbax checkpoint directory."""
     try:
-        import orbax.checkpoint as ocp
-        checkpointer = ocp.PyTreeCheckpointer()
-        return checkpointer.restore(str(checkpoint_path))
+        return _checkpointer().restore(str(checkpoint_path))
     except ImportError:
         print("Orbax not installed. Install with: pip install orbax-checkpoint")
         sys.exit(1)
 
 
-def load_flax_json(json_path: Path) -> dict:
-    """Load weights from Flax JSON export."""
+class LazyFlaxJson(Mapping):
+    """
+    Read-only view of a Flax JSON export.
+
+    Top-level entries (e.g. 'policy', 'normalizer') are streamed with ijson
+    the first time they are accessed, so unused subtrees such as the value
+    network are never built.
+    """
+
+    def __init__(self, json_path: Path):
+        self.json_path = json_path
+        self._cache = {}
+
+    def __getitem__(self, key):
+        if key not in self._cache:
+            with open(self.json_path, 'rb') as f:
+                items = ijson.items(f, key, use_float=True)
+                try:
+                    self._cache[key] = next(items)
+                except StopIteration:
+                    raise KeyError(key) from None
+        return self._cache[key]
+
+    def __iter__(self):
+        with open(self.json_path, 'rb') as f:
+            for prefix, event, value in ijson.parse(f):
+                if prefix == '' and event == 'map_key':
+                    yield value
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+
+def load_flax_json(json_path: Path):
+    """
+    Load weights from Flax JSON export.
+    
+    With ijson installed, a top-level object is returned as a LazyFlaxJson
+    that streams entries on demand. Anything else (e.g. an Orbax-style
+    [normalizer_dict, model_dict] list) is loaded in full, as without ijson.
+    """
+    if ijson is not None:
+        with open(json_path, 'rb') as f:
+            _, first_event, _ = next(ijson.parse(f), (None, None, None))
+        if first_event == 'start_map':
+            return LazyFlaxJson(json_path)
+    if orjson is not None:
+        with open(json_path, 'rb') as f:
+            return orjson.loads(f.read())
     with open(json_path, 'r') as f:
         return json.load(f)
 
 
-def extract_layer_params(params: dict) -> list:
+def _json_default(obj):
+    """
+    Serialize arrays the JSON encoder cannot write natively (non-contiguous or
+    float16 numpy arrays, jax.Array, numpy scalars) via tolist().
+    """
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def save_rtneural_json(rtneural: dict, output_path: Path):
+    """Write RTNeural dict to JSON. Numpy arrays are serialized directly."""
+    if orjson is not None:
+        # orjson returns one bytes object, so the file gets a single write
+        data = orjson.dumps(rtneural, default=_json_default,
+                            option=orjson.OPT_SERIALIZE_NUMPY)
+        with open(output_path, 'wb') as f:
+            f.write(data)
+    else:
+        # Stream chunks through a large buffer rather than holding str + bytes copies
+        with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            json.dump(rtneural, f, separators=(',', ':'), ensure_ascii=False,
+                      default=_json_default)
+
+
+def encode_array(arr, dtype=np.float32) -> dict:
+    """Pack an array as a base64 buffer (float32 by default) plus shape."""
+    arr = np.ascontiguousarray(arr, dtype=dtype)
+    return {
+        "__ndarray__": base64.b64encode(arr.tobytes()).decode(),
+        "shape": list(arr.shape),
+        "dtype": arr.dtype.name,
+    }
+
+
+def decode_array(obj: dict) -> np.ndarray:
+    """Inverse of encode_array."""
+    data = base64.b64decode(obj["__ndarray__"])
+    return np.frombuffer(data, dtype=obj["dtype"]).reshape(obj["shape"])
+
+
+def quantize_int8(kernel: np.ndarray) -> tuple:
     """
-    Extract layer parameters from Flax params structure.
+    Symmetric int8 quantization of an [in, out] kernel with one scale per
+    output channel, so that kernel ~= q * scales.
+    
+    Returns (q, scales) as int8 [in, out] and float32 [out] arrays.
+    """
+    scales = np.abs(kernel).max(axis=0) / 127.0
+    scales = np.where(scales > 0, scales, 1.0).astype(np.float32)
+    q = np.round(kernel / scales).astype(np.int8)
+    return q, scales
+
+
+def _iter_flax_layers(params: Mapping):
+    """
+    Yield (name, kernel, bias) for each Dense layer in a Flax params tree.
     
     Expects structure like:
     {
@@ -50,6 +212,9 @@ def extract_layer_params(params: dict) -> list:
         'hidden_0': {'kernel': [...], 'bias': [...]},
         ...
     }
+    
+    Layers may also be named 'Dense_N' or just 'N'. They are ordered by N;
+    gaps in the numbering are allowed. kernel and bias are float32 arrays.
     """
     # Navigate to the actual layer dict
     if 'params' in params and 'params' in params['params']:
@@ -59,75 +224,28 @@ def extract_layer_params(params: dict) -> list:
     else:
         layer_dict = params
     
-    # Find all hidden layers
-    layers = []
-    i = 0
-    while True:
-        layer_name = f'hidden_{i}'
-        if layer_name not in layer_dict:
-            # Also try just numbered layers
-            if str(i) not in layer_dict and f'Dense_{i}' not in layer_dict:
-                break
-            layer_name = str(i) if str(i) in layer_dict else f'Dense_{i}'
-        
-        layer_params = layer_dict[layer_name]
-        kernel = layer_params['kernel']
-        bias = layer_params['bias']
-        
-        # Convert to lists if numpy arrays
-        if hasattr(kernel, 'tolist'):
-            kernel = kernel.tolist()
-        if hasattr(bias, 'tolist'):
-            bias = bias.tolist()
-            
-        layers.append({
-            'kernel': kernel,
-            'bias': bias
-        })
-        i += 1
+    # Find all hidden layers ('hidden_N', 'Dense_N' or 'N'), ordered by N
+    layer_names = sorted(
+        (int(m.group(1)), name)
+        for name in layer_dict
+        if (m := LAYER_NAME_PATTERN.match(name))
+    )
     
-    return layers
+    for _, name in layer_names:
+        yield (
+            name,
+            np.asarray(layer_dict[name]['kernel'], np.float32),
+            np.asarray(layer_dict[name]['bias'], np.float32),
+        )
 
 
-def convert_to_rtneural(
-    source,
-    observation_size: int = 720,
-    observation_history: int = 20,
-    kp: float = 7.5,
-    kd: float = 0.25,
-    action_scale: float = 0.5,
-    activation: str = "elu",
-    default_joint_pos: list = None,
-    joint_upper_limits: list = None,
-    joint_lower_limits: list = None,
-) -> dict:
+def _unpack_checkpoint(source) -> tuple:
     """
-    Convert Flax/Orbax checkpoint to RTNeural format.
+    Split a loaded checkpoint into (normalizer_data, policy_params).
     
-    Args:
-        source: Loaded checkpoint (can be list or dict)
-        observation_size: Total observation vector size (default 720 = 20 frames × 36 features)
-        observation_history: Number of stacked frames
-        kp: Position gain
-        kd: Derivative gain
-        action_scale: Action scaling factor
-        activation: Activation function for hidden layers
-        default_joint_pos: Default joint positions (12 values)
-        joint_upper_limits: Joint upper limits (12 values)
-        joint_lower_limits: Joint lower limits (12 values)
+    Orbax checkpoints are [normalizer_dict, model_dict]; Flax JSON exports are
+    a mapping with 'normalizer' and 'policy' entries.
     """
-    
-    # Default joint values for Pupper
-    if default_joint_pos is None:
-        default_joint_pos = [0.26, 0.0, -0.52, -0.26, 0.0, 0.52, 
-                            0.26, 0.0, -0.52, -0.26, 0.0, 0.52]
-    if joint_upper_limits is None:
-        joint_upper_limits = [0.8, 1.2, 0.0, 0.0, 1.2, 1.2, 
-                             0.8, 1.2, 0.0, 0.0, 1.2, 1.2]
-    if joint_lower_limits is None:
-        joint_lower_limits = [-0.0, -1.2, -1.2, -0.8, -1.2, -0.0, 
-                             -0.0, -1.2, -1.2, -0.8, -1.2, -0.0]
-    
     # Handle Orbax checkpoint structure: [normalizer_dict, model_dict]
     if isinstance(source, list):
         if len(source) >= 2:
@@ -141,75 +259,272 @@ def convert_to_rtneural(
         model_data = source
     
     # Extract policy params
-    if isinstance(model_data, dict) and 'policy' in model_data:
+    if isinstance(model_data, Mapping) and 'policy' in model_data:
         policy_params = model_data['policy']
     else:
         policy_params = model_data
-    
-    # Extract normalizer (handle numpy arrays)
+    return normalizer_data, policy_params
+
+
+def _iter_policy_layers(source):
+    """
+    Yield (name, kernel, bias) for each policy Dense layer in a loaded Orbax
+    checkpoint or Flax JSON export.
+    """
+    _, policy_params = _unpack_checkpoint(source)
+    return _iter_flax_layers(policy_params)
+
+
+def _extract_normalizer(source) -> dict:
+    """Return the observation normalizer mean/std (numpy arrays are kept as-is)."""
+    normalizer_data, _ = _unpack_checkpoint(source)
     normalizer = {}
     if isinstance(normalizer_data, dict):
         if 'mean' in normalizer_data:
-            mean = normalizer_data['mean']
-            normalizer['mean'] = mean.tolist() if hasattr(mean, 'tolist') else mean
+            normalizer['mean'] = normalizer_data['mean']
         if 'std' in normalizer_data:
-            std = normalizer_data['std']
-            normalizer['std'] = std.tolist() if hasattr(std, 'tolist') else std
-    # Extract layers
-    layers = extract_layer_params(policy_params)
+            normalizer['std'] = normalizer_data['std']
+    return normalizer
+
+
+def extract_layer_params(params: dict) -> list:
+    """
+    Extract layer parameters from Flax params structure (see _iter_flax_layers).
+    
+    Returns a list of {'kernel', 'bias'} dicts holding float32 numpy arrays.
+    """
+    return [{'kernel': kernel, 'bias': bias} for _, kernel, bias in _iter_flax_layers(params)]
+
+
+def _joint_array(values, default: np.ndarray, name: str) -> np.ndarray:
+    """Return a float64 copy of values (or default), checking there are 12 joints."""
+    arr = np.array(default if values is None else values, dtype=np.float64)
+    if arr.shape != (12,):
+        raise ValueError(f"{name} must have 12 values, got shape {arr.shape}")
+    return arr
+
+
+def _build_layer(i, layer, is_last, activation, dense_style, binary, pretranspose,
+                 npz_name, quant):
+    """
+    Build the RTNeural entries for one Dense layer.
+    
+    Returns (rtneural_layers, npz_arrays): one dense entry, plus an activation
+    entry for the split style, and the arrays to save when npz_name is set.
+    """
+    _, kernel, bias = layer
+    
+    # Determine dimensions
+    in_features, out_features = kernel.shape
+    
+    # Last layer has no activation
+    layer_activation = "" if is_last else activation
     
+    rtneural_layer = {
+        "type": "dense",
+        "shape": [in_features, out_features],
+        "activation": layer_activation if dense_style == "combined" else "",
+        "weights": [kernel, bias]
+    }
+    npz_arrays = {}
+    scales = None
+    if quant == "int8":
+        kernel, scales = quantize_int8(kernel)
+        rtneural_layer["weights"] = [kernel, bias]
+    if pretranspose:
+        kernel = np.ascontiguousarray(kernel.T)
+        rtneural_layer["weights"] = [kernel, bias]
+        rtneural_layer["weights_layout"] = "row_major_out_in"
+    if npz_name is not None:
+        npz_arrays[f"w{i}"] = kernel
+        npz_arrays[f"b{i}"] = bias
+        del rtneural_layer["weights"]
+        rtneural_layer["weights_ref"] = [f"{npz_name}:w{i}", f"{npz_name}:b{i}"]
+        if scales is not None:
+            npz_arrays[f"s{i}"] = scales
+            rtneural_layer["scales_ref"] = f"{npz_name}:s{i}"
+    elif scales is not None:
+        encoded_kernel = encode_array(kernel, np.int8)
+        encoded_kernel["scales"] = scales
+        rtneural_layer["weights"] = [encoded_kernel, encode_array(bias)]
+    elif binary:
+        rtneural_layer["weights"] = [encode_array(kernel), encode_array(bias)]
+    
+    rtneural_layers = [rtneural_layer]
+    if dense_style == "split" and layer_activation:
+        rtneural_layers.append({
+            "type": "activation",
+            "shape": [out_features],
+            "activation": layer_activation
+        })
+    return rtneural_layers, npz_arrays
+
+
+def _build_rtneural(
+    layers,
+    normalizer: dict,
+    meta: dict,
+    activation: str = "elu",
+    dense_style: str = "combined",
+    binary: bool = False,
+    pretranspose: bool = False,
+    npz_path: Path = None,
+    quant: str = None,
+) -> dict:
+    """
+    Build the RTNeural dict from (name, kernel, bias) layers, a normalizer and
+    controller metadata (see DEFAULT_META). Other arguments are as for
+    convert_to_rtneural.
+    """
+    layers = list(layers)
     if not layers:
         raise ValueError("No layers found in checkpoint. Check the structure.")
     
     # Build RTNeural format
     rtneural = {
+        **meta,
+        "normalizer": normalizer,
+        "layers": []
+    }
+    
+    # Layers are independent, so build them in a pool (map keeps order). Only
+    # the numpy work in quantize_int8 can overlap; base64 encoding and tobytes
+    # hold the GIL, so --binary encoding is effectively serial.
+    build_layer = functools.partial(
+        _build_layer,
+        activation=activation,
+        dense_style=dense_style,
+        binary=binary,
+        pretranspose=pretranspose,
+        npz_name=npz_path.name if npz_path is not None else None,
+        quant=quant,
+    )
+    is_last = [i == len(layers) - 1 for i in range(len(layers))]
+    with ThreadPoolExecutor(max_workers=len(layers)) as executor:
+        built = list(executor.map(build_layer, range(len(layers)), layers, is_last))
+    
+    npz_arrays = {}
+    for rtneural_layers, arrays in built:
+        for layer in rtneural_layers:
+            print(f"  Layer {len(rtneural['layers'])}: {layer['type']} {layer['shape']} "
+                  f"activation='{layer['activation']}'")
+            rtneural["layers"].append(layer)
+        npz_arrays.update(arrays)
+    
+    if npz_path is not None:
+        np.savez(npz_path, **npz_arrays)
+    
+    return rtneural
+
+
+def convert_to_rtneural(
+    source,
+    observation_size: int = DEFAULT_META["in_shape"][1],
+    observation_history: int = DEFAULT_META["observation_history"],
+    kp: float = DEFAULT_META["kp"],
+    kd: float = DEFAULT_META["kd"],
+    action_scale: float = DEFAULT_META["action_scale"],
+    activation: str = "elu",
+    dense_style: str = "combined",
+    default_joint_pos: Union[list, np.ndarray] = None,
+    joint_upper_limits: Union[list, np.ndarray] = None,
+    joint_lower_limits: Union[list, np.ndarray] = None,
+    binary: bool = False,
+    pretranspose: bool = False,
+    npz_path: Path = None,
+    quant: str = None,
+) -> dict:
+    """
+    Convert Flax/Orbax checkpoint to RTNeural format.
+    
+    Args:
+        source: Loaded checkpoint (can be list or dict)
+        observation_size: Total observation vector size (default 720 = 20 frames × 36 features)
+        observation_history: Number of stacked frames
+        kp: Position gain
+        kd: Derivative gain
+        action_scale: Action scaling factor
+        activation: Activation function for hidden layers
+        dense_style: "combined" puts the activation on the dense layer itself;
+            "split" emits an unactivated dense layer followed by a separate
+            {"type": "activation"} layer
+        default_joint_pos: Default joint positions (12 values)
+        joint_upper_limits: Joint upper limits (12 values)
+        joint_lower_limits: Joint lower limits (12 values)
+        binary: Store weights as base64 float32 buffers (see encode_array)
+            instead of nested lists. Stock RTNeural cannot parse these.
+        pretranspose: Store kernels as [out, in] row-major and mark the layer
+            with weights_layout="row_major_out_in". "shape" stays [in, out].
+            Stock RTNeural (neural_controller) ignores weights_layout and
+            would load these kernels transposed without any error.
+        npz_path: If given, save kernels/biases to this .npz file (keys w{i}/b{i})
+            and replace each layer's "weights" with a "weights_ref" list of
+            "<npz name>:<key>" strings. Takes precedence over binary.
+        quant: "int8" to quantize kernels per output channel (see quantize_int8).
+            Kernels are stored as int8 buffers with their float32 "scales";
+            biases stay float32. Implies binary unless npz_path is set, in
+            which case scales are saved as s{i} and listed in "scales_ref".
+    """
+    
+    if dense_style not in ("combined", "split"):
+        raise ValueError(f"Unknown dense_style {dense_style!r}, expected 'combined' or 'split'")
+    if quant not in (None, "int8"):
+        raise ValueError(f"Unknown quant {quant!r}, expected 'int8'")
+    
+    # Default joint values for Pupper
+    default_joint_pos = _joint_array(default_joint_pos, DEFAULT_META["default_joint_pos"],
+                                     'default_joint_pos')
+    joint_upper_limits = _joint_array(joint_upper_limits, DEFAULT_META["joint_upper_limits"],
+                                      'joint_upper_limits')
+    joint_lower_limits = _joint_array(joint_lower_limits, DEFAULT_META["joint_lower_limits"],
+                                      'joint_lower_limits')
+    
+    meta = {
+        **DEFAULT_META,
         "in_shape": [1, observation_size],
         "observation_history": observation_history,
         "kp": kp,
         "kd": kd,
         "action_scale": action_scale,
-        "use_imu": True,
         "default_joint_pos": default_joint_pos,
         "joint_upper_limits": joint_upper_limits,
         "joint_lower_limits": joint_lower_limits,
-        "normalizer": normalizer,
-        "layers": []
     }
-    
-    for i, layer in enumerate(layers):
-        kernel = layer['kernel']
-        bias = layer['bias']
-        
-        # Determine dimensions
-        in_features = len(kernel)
-        out_features = len(kernel[0]) if kernel else len(bias)
-        
-        # Last layer has no activation
-        is_last = (i == len(layers) - 1)
-        layer_activation = "" if is_last else activation
-        
-        rtneural_layer = {
-            "type": "dense",
-            "shape": [in_features, out_features],
-            "activation": layer_activation,
-            "weights": [kernel, bias]
-        }
-        
-        rtneural["layers"].append(rtneural_layer)
-    
-    return rtneural
+    return _build_rtneural(
+        _iter_policy_layers(source),
+        _extract_normalizer(source),
+        meta,
+        activation=activation,
+        dense_style=dense_style,
+        binary=binary,
+        pretranspose=pretranspose,
+        npz_path=npz_path,
+        quant=quant,
+    )
 
 
 def main():
-    if len(sys.argv) < 3:
-        print(__doc__)
-        print("\nExample:")
-        print("  python orbax_to_rtneural.py my_checkpoint/ pure_rl_policy.json")
-        print("  python orbax_to_rtneural.py flax_export.json pure_rl_policy.json")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("input_path", type=Path, help="Orbax checkpoint directory or Flax JSON export")
+    parser.add_argument("output_path", type=Path, help="RTNeural JSON to write")
+    parser.add_argument("--binary", action="store_true",
+                        help="Store weights as base64 float32 buffers (not readable by stock RTNeural)")
+    parser.add_argument("--pretranspose", action="store_true",
+                        help="Store kernels as [out, in] row-major (sets weights_layout; "
+                             "not readable by stock RTNeural, which would silently misload them)")
+    parser.add_argument("--npz", action="store_true",
+                        help="Write weights to a .npz sidecar and reference them from the JSON")
+    parser.add_argument("--quant", choices=["int8"], default=None,
+                        help="Quantize kernels to int8 with per-output-channel scales")
+    parser.add_argument("--dense-style", choices=["combined", "split"], default="combined",
+                        help="Activation on the dense layer (combined) or as a separate layer (split)")
+    args = parser.parse_args()
     
-    input_path = Path(sys.argv[1])
-    output_path = Path(sys.argv[2])
+    input_path = args.input_path
+    output_path = args.output_path
     
     # Load source
     if input_path.is_dir():
@@ -221,19 +536,21 @@ def main():
     
     # Convert
     print("Converting to RTNeural format...")
-    rtneural = convert_to_rtneural(source)
+    npz_path = output_path.with_suffix('.npz') if args.npz else None
+    rtneural = convert_to_rtneural(source, dense_style=args.dense_style, binary=args.binary,
+                                   pretranspose=args.pretranspose, npz_path=npz_path,
+                                   quant=args.quant)
     
     # Save
-    with open(output_path, 'w') as f:
-        json.dump(rtneural, f)
+    save_rtneural_json(rtneural, output_path)
     
     print(f"\nSaved to: {output_path}")
+    if npz_path is not None:
+        print(f"  weights: {npz_path}")
     print(f"  in_shape: {rtneural['in_shape']}")
     print(f"  observation_history: {rtneural['observation_history']}")
     print(f"  Number of layers: {len(rtneural['layers'])}")
-    for i, layer in enumerate(rtneural['layers']):
-        print(f"    Layer {i}: {layer['type']} {layer['shape']} activation='{layer['activation']}'")
-    if rtneural.get('normalizer', {}).get('mean'):
+    if len(rtneural.get('normalizer', {}).get('mean', [])):
         print(f"  Normalizer: {len(rtneural['normalizer']['mean'])} values")
     
     print("\n✓ Conversion complete!")